@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Banc d'essai des programmes d'exemple.
+
+Usage:
+    banc_essai.py [nb_repetitions]
+
+Pour chaque programme du répertoire exemples, mesure la taille de la table
+de transitions, le nombre de pas et le temps d'exécution, sans puis avec
+l'optimisation des sauts (Compilateur.optimiser). Les programmes d'un même
+banc calculent le même résultat sur le ruban 0, par exemple avec un ou
+plusieurs rubans.
+
+Compare ensuite l'arithmétique unaire à l'arithmétique binaire, écrite avec
+un alphabet plus grand que {0,1}.
+
+"""
+import os
+import sys
+import time
+from functools import partial
+
+from machine_turing import (
+    Compilateur,
+    Execution,
+    Machine,
+    Ruban,
+    lire_source,
+    ruban_initial,
+)
+
+EXEMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exemples")
+
+# (programmes, n1, n2, position initiale de la tête)
+BANCS = [
+    (["addition.TS"], 3, 4, Ruban.DIM//2),
+    (["copie.TS", "copie2.TS"], 4, -1, 2),
+    (["copie.TS", "copie2.TS"], 12, -1, 2),
+    (["copie.TS", "copie2.TS"], 30, -1, 2),
+    (["multiplication.TS", "multiplication3.TS"], 2, 3, 2),
+    (["multiplication.TS", "multiplication3.TS"], 6, 6, 2),
+]
+
+# (programme unaire, programme binaire, n1, n2, résultat)
+BANCS_ALPHABET = [
+    ("double.TS", "double_binaire.TS", 10, -1, 20),
+    ("double.TS", "double_binaire.TS", 100, -1, 200),
+    ("addition.TS", "addition_binaire.TS", 30, 50, 80),
+    ("addition.TS", "addition_binaire.TS", 3000, 5000, 8000),
+]
+
+
+def rubans_initiaux(
+        n1:int,
+        n2:int,
+        p:int,
+        dim:int,
+        alphabet:str,
+        nb_rubans:int
+):
+    """Les rubans initiaux d'un programme.
+
+    Returns:
+        list(Ruban), le ruban des nombres n1 et n2 écrits selon l'alphabet
+        (voir ruban_initial) puis des rubans vides.
+
+    """
+    return [ruban_initial(n1, n2, alphabet, p, dim)] + [
+        Ruban(-1, -1, p, alphabet[0], dim) for _ in range(1, nb_rubans)
+    ]
+
+
+def mesurer(
+        fichier:str,
+        preparer,
+        optimiser:bool,
+        nb_repetitions:int = 5
+):
+    """Compile et exécute un programme d'exemple.
+
+    Args:
+        fichier(str): Le nom du programme dans le répertoire exemples.
+        preparer(function): Construit les rubans initiaux à partir de
+                l'alphabet et du nombre de rubans.
+        optimiser(bool): Applique Compilateur.optimiser.
+        nb_repetitions(int): Le nombre d'exécutions chronométrées.
+
+    Returns:
+        tuple(int, int, int, float, str), le nombre de rubans, le nombre de
+        transitions, le nombre de pas, le meilleur temps en secondes et le
+        ruban 0 final.
+
+    """
+    chaine = lire_source(os.path.join(EXEMPLES, fichier))
+    c = Compilateur(chaine)
+    c.compiler()
+    if optimiser:
+        c.optimiser()
+    MT = Machine(fichier, chaine, c.p_turing)
+
+    meilleur = None
+    for _ in range(nb_repetitions):
+        R = preparer(c.alphabet, MT.nb_rubans)
+        exec = Execution(MT, 1, R, 0)
+        debut = time.perf_counter()
+        exec.interprete()
+        duree = time.perf_counter() - debut
+        if meilleur is None or duree < meilleur:
+            meilleur = duree
+    return (
+        MT.nb_rubans,
+        len(c.p_turing),
+        exec.pas,
+        meilleur,
+        "".join(R[0].ruban),
+    )
+
+
+def main():
+    try:
+        nb_repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    except ValueError as e_value:
+        print(e_value)
+        sys.exit(2)
+
+    print("{:<20} {:>4} {:>4} {:>7} {:>6} {:>12} {:>8} {:>10}".format(
+        "programme", "n1", "n2", "rubans", "optim", "transitions", "pas",
+        "temps(ms)"))
+    for fichiers, n1, n2, p in BANCS:
+        rubans = set()
+        for fichier in fichiers:
+            for optimiser in (False, True):
+                nb_rubans, transitions, pas, duree, ruban = mesurer(
+                    fichier,
+                    partial(rubans_initiaux, n1, n2, p, Ruban.DIM),
+                    optimiser,
+                    nb_repetitions,
+                )
+                rubans.add(ruban)
+                print("{:<20} {:>4} {:>4} {:>7} {:>6} {:>12} {:>8} {:>10.3f}"
+                      .format(
+                          fichier,
+                          n1,
+                          n2,
+                          nb_rubans,
+                          "oui" if optimiser else "non",
+                          transitions,
+                          pas,
+                          duree * 1000,
+                      ))
+        if len(rubans) != 1:
+            print("{} : les rubans finaux diffèrent".format(
+                ", ".join(fichiers)))
+
+
+    print()
+    print("{:<20} {:>5} {:>5} {:>6} {:>12} {:>8} {:>10}".format(
+        "programme", "n1", "n2", "base", "transitions", "pas", "temps(ms)"))
+    for unaire, binaire, n1, n2, resultat in BANCS_ALPHABET:
+        dim = 2 * (n1 + n2) + 20
+        for fichier, base in ((unaire, 1), (binaire, 2)):
+            _, transitions, pas, duree, ruban = mesurer(
+                fichier,
+                partial(rubans_initiaux, n1, n2, 10, dim),
+                True,
+                nb_repetitions,
+            )
+            if base == 1:
+                valeur = ruban.count('1') - 1
+            else:
+                valeur = int(ruban.strip('_'), 2)
+            print("{:<20} {:>5} {:>5} {:>6} {:>12} {:>8} {:>10.3f}".format(
+                fichier,
+                n1,
+                n2,
+                base,
+                transitions,
+                pas,
+                duree * 1000,
+            ))
+            if valeur != resultat:
+                print("{} : résultat {} au lieu de {}".format(
+                    fichier, valeur, resultat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Recherche de castors affairés parmi les petites tables de transitions.
+
+Usage:
+    castor.py nb_etats [budget] [fichier_reprise] [nb_processus]
+
+Énumère les tables de Quadruplet à nb_etats états sur l'alphabet {0,1} et
+cherche la machine qui s'arrête après le plus grand nombre de pas, en
+partant d'un ruban vide. Comme pour Execution, la machine s'arrête quand
+aucune transition ne correspond à l'état courant et au caractère lu.
+
+Les tables sont construites sous forme normale arborescente : une machine
+est simulée jusqu'à ce qu'elle lise une transition non définie, puis les
+tables filles définissent cette transition. Ne sont énumérées que :
+    - les tables dont les états sont numérotés dans l'ordre de leur
+      première apparition (symétrie par renumérotation des états) ;
+    - les tables dont le premier déplacement est 'D' (symétrie
+      gauche/droite).
+
+Chaque machine dispose d'un budget de pas. Les boucles sont détectées
+quand une configuration se répète (algorithme de Brent) ou quand la tête
+repart vers le ruban vide dans le même état sans revenir en arrière.
+
+Les sous-arbres de la frontière de recherche sont explorés en parallèle.
+Une tâche simule au plus MACHINES_PAR_TACHE machines, puis rend la partie
+inexplorée de son sous-arbre, qui rejoint la frontière. Après chaque tâche,
+la frontière et le bilan sont écrits dans le fichier de reprise : relancer
+la même commande reprend la recherche.
+
+"""
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from machine_turing import Quadruplet
+
+ACTIONS = ('D', 'G', '0', '1')
+MACHINES_PAR_TACHE = 20000
+
+
+def simuler(
+        table:dict,
+        budget:int
+):
+    """Exécute une table à partir d'un ruban vide.
+
+    Args:
+        table(dict((int, int), (str, int))): Les transitions, (état,
+                caractère) -> (action, état suivant).
+        budget(int): Le nombre maximal de pas.
+
+    Returns:
+        tuple(str, int, int, int, int), le statut ('arret', 'boucle' ou
+        'indecis'), le nombre de pas, l'état et le caractère de la
+        transition manquante, et le nombre de '1' sur le ruban.
+
+    """
+    ruban = bytearray(64)
+    origine = 32                # indice de la case 0 dans ruban
+    oeil = 0
+    etat = 1
+    gauche = droite = 0         # cases extrêmes déjà visitées
+    fuites_g = list()           # (case, état) à chaque nouvelle case gauche
+    fuites_d = list()
+    etats_g = dict()
+    etats_d = dict()
+    brent_etat, brent_oeil, brent_ruban = etat, oeil, (0, b"")
+    puissance = longueur = 1
+
+    pas = 0
+    while True:
+        c = ruban[origine + oeil]
+        if (etat, c) not in table:
+            return 'arret', pas, etat, c, ruban.count(1)
+        if pas >= budget:
+            return 'indecis', pas, etat, c, ruban.count(1)
+        action, etat = table[(etat, c)]
+        pas += 1
+
+        if action == 'D':
+            oeil += 1
+            if origine + oeil >= len(ruban):
+                ruban.extend(bytes(len(ruban)))
+            while fuites_g and fuites_g[-1][0] < oeil:
+                del etats_g[fuites_g.pop()[1]]
+            if oeil > droite:
+                droite = oeil
+                if etat in etats_d:
+                    return 'boucle', pas, etat, 0, ruban.count(1)
+                fuites_d.append((oeil, etat))
+                etats_d[etat] = oeil
+        elif action == 'G':
+            oeil -= 1
+            if origine + oeil < 0:
+                ruban[0:0] = bytes(len(ruban))
+                origine += len(ruban) // 2
+            while fuites_d and fuites_d[-1][0] > oeil:
+                del etats_d[fuites_d.pop()[1]]
+            if oeil < gauche:
+                gauche = oeil
+                if etat in etats_g:
+                    return 'boucle', pas, etat, 0, ruban.count(1)
+                fuites_g.append((oeil, etat))
+                etats_g[etat] = oeil
+        else:
+            ruban[origine + oeil] = 1 if action == '1' else 0
+
+        if etat == brent_etat and oeil == brent_oeil \
+                and _contenu(ruban, origine) == brent_ruban:
+            return 'boucle', pas, etat, 0, ruban.count(1)
+        longueur -= 1
+        if longueur == 0:
+            brent_etat, brent_oeil = etat, oeil
+            brent_ruban = _contenu(ruban, origine)
+            puissance *= 2
+            longueur = puissance
+
+
+def _contenu(
+        ruban:bytearray,
+        origine:int
+):
+    """Le contenu du ruban, indépendant de sa taille en mémoire.
+
+    Returns:
+        tuple(int, bytes), la case du premier '1' et les cases jusqu'au
+        dernier '1'.
+
+    """
+    mot = ruban.strip(b"\x00")
+    if not mot:
+        return 0, b""
+    return len(ruban) - len(ruban.lstrip(b"\x00")) - origine, bytes(mot)
+
+
+def enfants(
+        table:dict,
+        etat:int,
+        caractere:int,
+        nb_etats:int
+):
+    """Les tables filles qui définissent la transition manquante.
+
+    Args:
+        table(dict): La table mère.
+        etat(int): L'état de la transition manquante.
+        caractere(int): Le caractère de la transition manquante.
+        nb_etats(int): Le nombre maximal d'états.
+
+    Returns:
+        list(dict), les tables filles sous forme normale.
+
+    """
+    utilises = max(
+        [1] + [q for q, _ in table] + [q for _, q in table.values()]
+    )
+    deplace = any(action in 'GD' for action, _ in table.values())
+    tables = list()
+    for action in ACTIONS:
+        if action == 'G' and not deplace:
+            continue
+        for suivant in range(1, min(utilises + 1, nb_etats) + 1):
+            if action == str(caractere) and suivant == etat:
+                # réécrit le caractère lu sans changer d'état : boucle
+                continue
+            fille = dict(table)
+            fille[(etat, caractere)] = (action, suivant)
+            tables.append(fille)
+    return tables
+
+
+def nouveau_bilan():
+    """Un bilan de recherche vide.
+
+    Returns:
+        dict, les compteurs 'machines', 'arrets', 'boucles' et 'indecis',
+        et la meilleure machine trouvée ('meilleur_pas', 'meilleur_uns',
+        'meilleure').
+
+    """
+    return {
+        'machines': 0,
+        'arrets': 0,
+        'boucles': 0,
+        'indecis': 0,
+        'meilleur_pas': -1,
+        'meilleur_uns': 0,
+        'meilleure': None,
+    }
+
+
+def fusionner(
+        bilan:dict,
+        autre:dict
+):
+    """Ajoute le bilan autre au bilan."""
+    for cle in ('machines', 'arrets', 'boucles', 'indecis'):
+        bilan[cle] += autre[cle]
+    if autre['meilleur_pas'] > bilan['meilleur_pas']:
+        bilan['meilleur_pas'] = autre['meilleur_pas']
+        bilan['meilleur_uns'] = autre['meilleur_uns']
+        bilan['meilleure'] = autre['meilleure']
+
+
+def _evaluer(
+        table:dict,
+        nb_etats:int,
+        budget:int,
+        bilan:dict
+):
+    """Simule une table, met à jour le bilan et renvoie ses filles."""
+    statut, pas, etat, caractere, uns = simuler(table, budget)
+    bilan['machines'] += 1
+    if statut == 'boucle':
+        bilan['boucles'] += 1
+        return list()
+    if statut == 'indecis':
+        bilan['indecis'] += 1
+        return list()
+    bilan['arrets'] += 1
+    if pas > bilan['meilleur_pas']:
+        bilan['meilleur_pas'] = pas
+        bilan['meilleur_uns'] = uns
+        bilan['meilleure'] = en_liste(table)
+    # une table complète ne peut plus s'arrêter
+    if len(table) + 1 >= 2 * nb_etats:
+        return list()
+    return enfants(table, etat, caractere, nb_etats)
+
+
+def explorer(
+        table:list,
+        nb_etats:int,
+        budget:int,
+        nb_machines:int = MACHINES_PAR_TACHE
+):
+    """Explore en profondeur le sous-arbre d'une table.
+
+    Args:
+        table(list): La racine du sous-arbre, au format de en_liste.
+        nb_etats(int): Le nombre maximal d'états.
+        budget(int): Le nombre maximal de pas par machine.
+        nb_machines(int): Le nombre maximal de machines simulées.
+
+    Returns:
+        tuple(dict, list), le bilan des machines simulées et les racines,
+        au format de en_liste, des parties du sous-arbre qui restent à
+        explorer.
+
+    """
+    bilan = nouveau_bilan()
+    pile = [en_table(table)]
+    while pile and bilan['machines'] < nb_machines:
+        pile.extend(_evaluer(pile.pop(), nb_etats, budget, bilan))
+    return bilan, [en_liste(t) for t in pile]
+
+
+def en_liste(table:dict):
+    """Table sérialisable en JSON : [[état, caractère, action, suivant]]."""
+    return [[q, c, action, suivant]
+            for (q, c), (action, suivant) in sorted(table.items())]
+
+
+def en_table(liste:list):
+    """Table reconstruite à partir de en_liste."""
+    return {(q, c): (action, suivant) for q, c, action, suivant in liste}
+
+
+def quadruplets(liste:list):
+    """Les transitions d'une table au format de en_liste.
+
+    Returns:
+        list(Quadruplet), utilisable par Machine et Execution.
+
+    """
+    return [Quadruplet(q, str(c), action, suivant, "CAS")
+            for q, c, action, suivant in liste]
+
+
+def sauvegarder(
+        fichier:str,
+        etat_recherche:dict
+):
+    """Écrit l'état de la recherche, en remplaçant le fichier d'un coup."""
+    temporaire = fichier + ".tmp"
+    with open(temporaire, 'w') as f:
+        json.dump(etat_recherche, f)
+    os.replace(temporaire, fichier)
+
+
+def rechercher(
+        nb_etats:int,
+        budget:int,
+        fichier:str,
+        nb_processus:int = None
+):
+    """Recherche le castor affairé à nb_etats états.
+
+    Reprend la recherche enregistrée dans fichier s'il existe.
+
+    Args:
+        nb_etats(int): Le nombre d'états.
+        budget(int): Le nombre maximal de pas par machine.
+        fichier(str): Le fichier de reprise.
+        nb_processus(int): La taille du pool, le nombre de cœurs par
+                defaut.
+
+    Returns:
+        dict, le bilan de la recherche.
+
+    Raises:
+        ValueError: Le fichier de reprise concerne une autre recherche.
+
+    """
+    if os.path.exists(fichier):
+        with open(fichier) as f:
+            etat_recherche = json.load(f)
+        if (etat_recherche['nb_etats'] != nb_etats
+                or etat_recherche['budget'] != budget):
+            raise ValueError(
+                "le fichier de reprise '{}' concerne une autre recherche"
+                .format(fichier))
+    else:
+        # découpe l'arbre en largeur jusqu'à occuper tous les processus
+        bilan = nouveau_bilan()
+        cible = 8 * (nb_processus or os.cpu_count() or 1)
+        frontiere = deque([dict()])
+        while frontiere and len(frontiere) < cible:
+            frontiere.extend(
+                _evaluer(frontiere.popleft(), nb_etats, budget, bilan))
+        etat_recherche = {
+            'nb_etats': nb_etats,
+            'budget': budget,
+            'frontiere': [en_liste(table) for table in frontiere],
+            'bilan': bilan,
+        }
+        sauvegarder(fichier, etat_recherche)
+
+    # une tâche par table de la frontière ; une tâche terminée remplace sa
+    # table par les racines de ce qui reste à explorer
+    with ProcessPoolExecutor(nb_processus) as pool:
+        taches = {
+            pool.submit(explorer, table, nb_etats, budget): table
+            for table in etat_recherche['frontiere']
+        }
+        while taches:
+            finies, _ = wait(taches, return_when=FIRST_COMPLETED)
+            for tache in finies:
+                taches.pop(tache)
+                bilan, reste = tache.result()
+                fusionner(etat_recherche['bilan'], bilan)
+                for racine in reste:
+                    taches[pool.submit(
+                        explorer, racine, nb_etats, budget)] = racine
+            etat_recherche['frontiere'] = list(taches.values())
+            sauvegarder(fichier, etat_recherche)
+    return etat_recherche['bilan']
+
+
+def main():
+    # lecture et controle des arguments
+    try:
+        nb_etats = int(sys.argv[1])
+        budget = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+        fichier = sys.argv[3] if len(sys.argv) > 3 \
+            else "castor{}.json".format(nb_etats)
+        nb_processus = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    except IndexError:
+        print("paramètres d'appel incorrects")
+        sys.exit(1)
+    except ValueError as e_value:
+        print(e_value)
+        sys.exit(2)
+
+    try:
+        bilan = rechercher(nb_etats, budget, fichier, nb_processus)
+    except ValueError as e_value:
+        print(e_value)
+        sys.exit(2)
+
+    print("{} machines : {} arrêts, {} boucles, {} indécises".format(
+        bilan['machines'],
+        bilan['arrets'],
+        bilan['boucles'],
+        bilan['indecis'],
+    ))
+    if bilan['meilleure'] is not None:
+        print("{} pas, {} bâtons :".format(
+            bilan['meilleur_pas'],
+            bilan['meilleur_uns'],
+        ))
+        for quad in quadruplets(bilan['meilleure']):
+            quad.afficher()
+
+
+if __name__ == "__main__":
+    main()
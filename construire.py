@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Construction en parallèle de tous les programmes *.TS d'un répertoire.
+
+Usage:
+    construire.py repertoire_source repertoire_sortie [nb_processus]
+
+Chaque fichier *.TS trouvé sous repertoire_source est compilé dans un
+processus du pool. La table de transitions est écrite dans
+repertoire_sortie, avec la même arborescence et l'extension .MT, un
+quadruplet par ligne. L'alphabet de chaque fichier est celui déclaré en
+tête du fichier (voir Compilateur). Une erreur dans un fichier est
+signalée sans interrompre la construction des autres.
+
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from machine_turing import Compilateur, lire_source
+
+
+def chercher_sources(racine:str):
+    """Cherche les fichiers *.TS sous un répertoire.
+
+    Args:
+        racine(str): Le répertoire à parcourir.
+
+    Returns:
+        list(str), les chemins des fichiers sources, triés.
+
+    """
+    sources = list()
+    for repertoire, _, fichiers in os.walk(racine):
+        for fichier in fichiers:
+            if os.path.splitext(fichier)[1].upper() == ".TS":
+                sources.append(os.path.join(repertoire, fichier))
+    return sorted(sources)
+
+
+def construire_fichier(
+        source:str,
+        racine:str,
+        sortie:str
+):
+    """Compile un fichier source et écrit sa table de transitions.
+
+    Args:
+        source(str): Le chemin du fichier source.
+        racine(str): Le répertoire source de la construction.
+        sortie(str): Le répertoire de sortie.
+
+    Returns:
+        tuple(str, str), le fichier source et le message d'erreur, None
+        si la construction a réussi.
+
+    """
+    try:
+        chaine = lire_source(source)
+    except IOError:
+        return source, "erreur en lecture du fichier source"
+
+    try:
+        c = Compilateur(chaine)
+    except ValueError as e_value:
+        return source, str(e_value)
+    e = c.traduire()
+    if e:
+        return source, c.message_erreur(e)
+    c.optimiser()
+
+    cible = os.path.join(
+        sortie,
+        os.path.splitext(os.path.relpath(source, racine))[0] + ".MT"
+    )
+    try:
+        os.makedirs(os.path.dirname(cible), exist_ok=True)
+        with open(cible, 'w') as MTFile:
+            for quad in c.p_turing:
+                MTFile.write(quad.en_chaine() + "\n")
+    except IOError:
+        return source, "erreur en écriture du fichier '{}'".format(cible)
+    return source, None
+
+
+def main():
+    # lecture et controle des arguments
+    try:
+        racine = sys.argv[1]
+        sortie = sys.argv[2]
+        nb_processus = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    except IndexError:
+        print("paramètres d'appel incorrects")
+        sys.exit(1)
+    except ValueError as e_value:
+        print(e_value)
+        sys.exit(2)
+    if nb_processus is not None and nb_processus < 1:
+        print("le nombre de processus doit être au moins 1")
+        sys.exit(2)
+    if not os.path.isdir(racine):
+        print("le répertoire source '{}' n'existe pas.".format(racine))
+        sys.exit(1)
+
+    sources = chercher_sources(racine)
+    nb_erreurs = 0
+    with ProcessPoolExecutor(nb_processus) as pool:
+        taches = [
+            (source, pool.submit(construire_fichier, source, racine, sortie))
+            for source in sources
+        ]
+        for source, tache in taches:
+            try:
+                _, erreur = tache.result()
+            except Exception as e_tache:
+                # une erreur imprévue ne concerne que ce fichier
+                erreur = "erreur interne : {!r}".format(e_tache)
+            if erreur:
+                nb_erreurs += 1
+                print("{} : {}".format(source, erreur))
+
+    print("{} fichier(s) compilé(s), {} erreur(s)".format(
+        len(sources) - nb_erreurs,
+        nb_erreurs,
+    ))
+    if nb_erreurs:
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
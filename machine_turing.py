@@ -1,30 +1,57 @@
 """ Une machine de Turing traduite de celle de M. Claude del Vigna.
 
+Fonctions:
+    lire_source: Lit un fichier source (*.TS).
+    ruban_initial: Le ruban des nombres d'entrée pour un alphabet.
+
 Classes:
     Compilateur: Trauduit le programme en une table de transitions.
+    Debogueur: Points d'arrêt conditionnels sur une exécution.
     Execution: Interprète les actions des quadruplets.
     Machine: Le programme source et le programme Turing.
+    PointArret: Un point d'arrêt du débogueur.
     Quadruplet: Fonction de transition.
     Ruban: Le ruban et la tête de lecture de la machine de Turing.
 
     TODO(Yizhou, yizhou.xu8859@gmail.com):
-        DIM setter, extension dynamique du ruban
+        extension dynamique du ruban
 
 """
 import sys
 
 
+def lire_source(nom_fichier:str):
+    """Lit un fichier source (*.TS) en une seule fois.
+
+    Chaque octet du fichier devient un caractère de la chaîne renvoyée.
+
+    Args:
+        nom_fichier(str): Le chemin du fichier source.
+
+    Returns:
+        str, le programme source.
+
+    Raises:
+        FileNotFoundError: Le fichier n'existe pas.
+        IOError: Erreur en lecture du fichier.
+
+    """
+    with open(nom_fichier, 'rb') as TSFile:
+        return TSFile.read().decode('latin-1')
+
+
 class Ruban:
     """Le ruban et la tête de lecture de la machine de Turing.
 
     Attributes:
-        DIM(int): La longeur du ruban.
+        DIM(int): La longeur du ruban par defaut.
         ruban(list(str)): Une liste de string qui représente le ruban.
         oeil(int): La tête de lecture.
 
     Methods:
         cellule(): Méthode getter de la case du ruban.
         affecter(): Méthode setter de la case du ruban.
+        inscrire(): Écrit un mot sur le ruban.
         afficher(): Affiche le ruban et la tête de lecture.
 
     """
@@ -34,7 +61,9 @@ class Ruban:
             self,
             n1:int = -1,
             n2:int = -1,
-            p:int = DIM//2
+            p:int = DIM//2,
+            blanc:str = '0',
+            dim:int = DIM
     ):
         """Instancie un Ruban.
 
@@ -46,6 +75,8 @@ class Ruban:
             n2(int): Le deuxième nombre sur le ruban, -1 par defaut.
             p(int): La position initiale de la tête de lecture,
                     Au milieu du ruban par defaut.
+            blanc(str): Le symbole des cases vides, '0' par defaut.
+            dim(int): La longueur du ruban, DIM par defaut.
 
         Examples:
             R1 = Ruban(2)
@@ -59,7 +90,7 @@ class Ruban:
                  X
 
         """
-        self.ruban = ['0' for _ in range(Ruban.DIM)]
+        self.ruban = [blanc for _ in range(dim)]
         k = p
         try:
             for _ in range(0, n1+1):
@@ -84,7 +115,7 @@ class Ruban:
             i(int): L'indice de la case.
 
         Returns:
-            str, la valeur('1'/'0') dans l'ième case.
+            str, le symbole dans l'ième case.
 
         """
         return self.ruban[i]
@@ -94,21 +125,103 @@ class Ruban:
             i:int,
             v:str
     ):
-        """Affecte la valeur(1/0) donné par v à l'ième case.
+        """Affecte le symbole donné par v à l'ième case.
 
         Args:
             i(int): L'indice de la case.
-            v(str): La valeur('1'/'0') à écrire.
+            v(str): Le symbole à écrire.
 
         """
         self.ruban[i] = v
 
+    def inscrire(
+            self,
+            mot:str,
+            i:int
+    ):
+        """Écrit un mot sur le ruban à partir de l'ième case.
+
+        Args:
+            mot(str): Les symboles à écrire.
+            i(int): L'indice de la première case.
+
+        Examples:
+            R = Ruban(blanc='_', dim=20, p=5)
+            R.inscrire("101_11", R.oeil)
+            _____101_11_________
+                 X
+
+        """
+        if i < 0 or i + len(mot) > len(self.ruban):
+            print("Le mot est trop grand pour notre petit ruban!")
+            sys.exit(2)
+        self.ruban[i:i+len(mot)] = list(mot)
+
     def afficher(self):
         """Affiche le ruban et la tête de lecture."""
         print("".join(self.ruban))
         print(" " * self.oeil + "X")
 
 
+def ruban_initial(
+        n1:int,
+        n2:int,
+        alphabet:str = "01",
+        p:int = Ruban.DIM//2,
+        dim:int = Ruban.DIM
+):
+    """Construit le ruban des nombres d'entrée pour un alphabet.
+
+    Si l'alphabet contient, en plus du blanc, les chiffres '0' à 'b-1'
+    (b >= 2), les nombres sont écrits en base b et séparés par un blanc.
+    Sinon ils sont écrits en base 1, comme pour Ruban(n1, n2, p), avec le
+    symbole '1' s'il est dans l'alphabet, le deuxième symbole sinon.
+    Un nombre égal à -1 n'est pas écrit.
+
+    Args:
+        n1(int): Le premier nombre.
+        n2(int): Le deuxième nombre.
+        alphabet(str): L'alphabet, le premier symbole est le blanc.
+        p(int): La position initiale de la tête de lecture.
+        dim(int): La longueur du ruban.
+
+    Returns:
+        Ruban, le ruban initial.
+
+    Examples:
+        ruban_initial(5, 2, "_01")
+        ___________________________________101_10_____________________________
+                                           X
+        ruban_initial(2, 1, "_ab")
+        ___________________________________aaa__aa____________________________
+                                           X
+
+    """
+    blanc = alphabet[0]
+    R = Ruban(p=p, blanc=blanc, dim=dim)
+    chiffres = "0123456789"
+    base = 0
+    while base < len(chiffres) and chiffres[base] in alphabet[1:]:
+        base += 1
+    if base < 2:
+        marque = '1' if '1' in alphabet[1:] else alphabet[1]
+        mot = marque * (n1 + 1) + blanc * 2 + marque * (n2 + 1)
+        R.inscrire(mot.rstrip(blanc), p)
+        return R
+
+    def ecrire(n):
+        mot = ""
+        while True:
+            mot = chiffres[n % base] + mot
+            n //= base
+            if n == 0:
+                return mot
+
+    mots = [ecrire(n) for n in (n1, n2) if n >= 0]
+    R.inscrire(blanc.join(mots), p)
+    return R
+
+
 class Quadruplet:
     """Quadruplet (transition) de la machine de Turing.
     
@@ -117,39 +230,104 @@ class Quadruplet:
 
     Attributes:
         etat_i(int): L'état d'entrée.
-        caractere(str): {'1','0'}, la valeur de la case courrente.
-        action(str): {'D','G','1','0','I'}, l'action de la tếte de lecture.
+        JOKER(str): Le caractère qui correspond à tout symbole sans
+                    transition particulière.
+        RIEN(str): L'action qui ne modifie ni le ruban ni la tête.
+        COMMANDES(str): Les actions qui n'écrivent pas sur le ruban.
+        RESERVES(str): Les caractères interdits dans l'alphabet.
+        caractere(str): Un symbole de l'alphabet ou JOKER, la valeur de la
+                    case courrente.
+        action(str): Une des COMMANDES ou le symbole à écrire, l'action
+                    de la tếte de lecture.
+        ecriture(bool): L'action écrit le symbole action sur le ruban.
+                    Par defaut, vrai si action n'est pas une des COMMANDES.
         etat_f(int): L'état de sortie.
         provenance(): L'instruction qui produit la transition.
                     {'BCL','IMP','GAU','DRO','SI',...}
+        ruban(int): Le numéro du ruban lu et modifié par la transition,
+                    0 par defaut.
+        position(int): La position dans le programme source de
+                    l'instruction qui produit la transition, -1 par defaut.
+        positions_sautees(set(int)): Les positions des sauts supprimés par
+                    Compilateur.optimiser qui suivaient la transition : ils
+                    auraient été exécutés juste après elle.
 
-    Method:
+    Methods:
+        en_chaine(): Le quadruplet sous forme de texte.
         afficher(): Affiche le quadruplet.
+        provient_de(): La transition provient de l'instruction donnée.
 
     """
+    JOKER = '*'
+    RIEN = '='
+    COMMANDES = "DGPI" + RIEN
+    RESERVES = JOKER
+
     def __init__(
             self,
             etat_i,
             caractere,
             action,
             etat_f,
-            provenance
+            provenance,
+            ruban = 0,
+            position = -1,
+            ecriture = None
     ):
         self.etat_i = etat_i
         self.caractere = caractere
         self.action = action
+        self.ecriture = action not in Quadruplet.COMMANDES \
+            if ecriture is None else ecriture
         self.etat_f = etat_f
         self.provenance = provenance
+        self.ruban = ruban
+        self.position = position
+        self.positions_sautees = set()
 
-    def afficher(self):
-        """Affiche le quadruplet."""
-        print("{} {} {} {} {}".format(
+    def en_chaine(self):
+        """Le quadruplet sous forme de texte.
+
+        Returns:
+            str, 'etat_i caractere action etat_f provenance', suivi de
+            '@ruban' si la transition porte sur un autre ruban que le 0.
+            Un symbole écrit qui est aussi une des COMMANDES est placé
+            entre apostrophes.
+
+        """
+        action = self.action
+        if self.ecriture and action in Quadruplet.COMMANDES:
+            action = "'{}'".format(action)
+        chaine = "{} {} {} {} {}".format(
             self.etat_i,
             self.caractere,
-            self.action,
+            action,
             self.etat_f,
             self.provenance,
-        ))
+        )
+        if self.ruban:
+            chaine += " @{}".format(self.ruban)
+        return chaine
+
+    def afficher(self):
+        """Affiche le quadruplet."""
+        print(self.en_chaine())
+
+    def provient_de(
+            self,
+            position:int
+    ):
+        """Indique si la transition provient de l'instruction à la position
+        donnée, directement ou par un saut supprimé qui la suivait.
+
+        Args:
+            position(int): La position dans le programme source.
+
+        Returns:
+            bool
+
+        """
+        return position == self.position or position in self.positions_sautees
 
 
 class Machine:
@@ -159,6 +337,7 @@ class Machine:
         __nom_fichier(str): Le nom du fichier source.
         __programme_source(str): Le fichier source (*.TS).
         programme_turing(list(Quadruplet)): Une liste de Quadruplet.
+        nb_rubans(int): Le nombre de rubans utilisés par le programme.
 
     Method:
         afficher(): Affiche les transitions de la machine.
@@ -173,6 +352,10 @@ class Machine:
         self.__nom_fichier = nom_fichier
         self.__programme_source = programme_source
         self.programme_turing = programme_turing[0]
+        self.nb_rubans = 1 + max(
+            (quad.ruban for quad in self.programme_turing),
+            default=0
+        )
 
     def afficher(self):
         """Affiche les transitions de la machine."""
@@ -184,24 +367,94 @@ class Compilateur:
     """Compilateur pour traduire le programme source en programme Turing.
 
     Attributes:
+        ERREURS(dict(int, str)): Les messages des erreurs de syntaxe.
+        ENTETE(str): Le début de la ligne qui déclare l'alphabet en tête du
+                programme source.
+        alphabet(str): Les symboles du ruban, le premier est le blanc.
         p_turing(list(Quadruplet)): Le programme Turing, une liste de
                 transitions.
         __programme(str): Le programme source (*.TS).
         __pile(list(int)): utile pour réaliser la boucle.
         __p(int): La position dans le programme source.
         __etat_entree(str): L'état d'entrée.
+        __etat_initial(int): L'état initial du programme Turing.
+        __ruban(int): Le ruban sélectionné par l'instruction '@'.
+        __debut(int): La position de l'instruction en cours de compilation.
         __XX(int) : permet de générer de nouveaux états à la demande
+        __routines(dict(str, int)): La position du corps de chaque routine
+                dans le programme source.
+        __appels(list(str)): Les routines en cours d'expansion.
 
     Methods:
         init_compiler(): Initialise le compilateur.
         compiler: Compile le programme source (*.TS).
+        traduire: Compile le programme source, renvoie le code d'erreur.
+        message_erreur: Décrit une erreur de syntaxe.
+        optimiser: Supprime les états qui ne font que sauter vers un autre.
 
     """
+    ERREURS = {
+        2: "mot clé <si> attendu",
+        3: "caractère ( attendu",
+        4: "caractère ) attendu",
+        5: "caractère } attendu",
+        7: "caractère G attendu",
+        8: "caractère D attendu",
+        9: "mot clé <fin> attendu",
+        12: "caractère P attendu",
+        13: "caractère I attendu",
+        14: "caractère # attendu",
+        15: "mot clé <boucle> attendu",
+        19: "instruction attendue",
+        20: "caractère % attendu",
+        22: "symbole de l'alphabet attendu",
+        23: "fin du programme source inattendue",
+        24: "mot clé <routine> attendu",
+        25: "mot clé <appel> attendu",
+        26: "nom de routine attendu",
+        27: "routine non définie",
+        28: "appel récursif de routine",
+        29: "caractère @ attendu",
+        30: "numéro de ruban attendu",
+        31: "caractère ' attendu",
+        32: "instructions trop imbriquées",
+        33: "routine déjà définie",
+    }
+
+    ENTETE = "%alphabet "
+
     def __init__(
             self,
-            c:str
+            c:str,
+            alphabet:str = None
     ):
+        """Instancie un Compilateur.
+
+        L'alphabet peut être déclaré par la première ligne du programme
+        source, qui est aussi un commentaire ; les espaces en fin de ligne
+        sont ignorés :
+            %alphabet _01xy
+
+        Args:
+            c(str): Le programme source (*.TS).
+            alphabet(str): Les symboles du ruban. Par defaut, l'alphabet
+                    déclaré en tête du programme source, sinon "01".
+
+        Raises:
+            ValueError: L'alphabet a moins de deux symboles, un symbole en
+                    double ou un caractère de Quadruplet.RESERVES.
+
+        """
+        if alphabet is None:
+            alphabet = "01"
+            if c.startswith(Compilateur.ENTETE):
+                alphabet = c[len(Compilateur.ENTETE):].split('\n', 1)[0] \
+                    .rstrip()
+        if (len(alphabet) < 2 or len(set(alphabet)) != len(alphabet)
+                or any(c0 in Quadruplet.RESERVES for c0 in alphabet)):
+            raise ValueError("alphabet invalide : '{}'".format(alphabet))
         self.__programme = c
+        self.alphabet = alphabet
         self.init_compiler()
 
     def init_compiler(self):
@@ -209,45 +462,123 @@ class Compilateur:
         self.__pile =list()
         self.__p = 0
         self.__XX = -1
+        self.__routines = dict()
+        self.__appels = list()
+        self.__ruban = 0
+        self.__debut = 0
 
     def compiler(self):
         """Compile le programme source.
 
         Traduit le programme de source (*.TS) en langage de la machine de
         Turing, c'est-à-dire une liste de transitions.
+        Affiche l'erreur de syntaxe et quitte le programme en cas d'échec.
 
         """
-        self.init_compiler()
-        self.__pile.append(self.__nouvel_etat())
-        self.__etat_entree = self.__nouvel_etat()
-        erreurs = {
-            2: "mot clé <si> attendu",
-            3: "caractère ( attendu",
-            4: "caractère ) attendu",
-            5: "caractère } attendu",
-            7: "caractère G attendu",
-            8: "caractère D attendu",
-            9: "mot clé <fin> attendu",
-            10: "caractère 1 attendu",
-            11: "caractère 0 attendu",
-            12: "caractère P attendu",
-            13: "caractère I attendu",
-            14: "caractère # attendu",
-            15: "mot clé <boucle> attendu",
-            19: "instruction attendue",
-            20: "caractère % attendu",
-            22: "caractère 0 ou 1 attendu",
-        }
-        e = self.__AXIOME()
+        e = self.traduire()
         if e:
-            print("erreur de syntaxe : ", end="")
-            print(erreurs[e] if e in erreurs else "erreur inconnue", end=" ")
-            print("à la position", end=" ")
-            print(self.__p, end=" ")
+            print(self.message_erreur(e), end=" ")
             print("du programme source :")
             print(self.__programme[:self.__p])
             sys.exit()
 
+    def traduire(self):
+        """Compile le programme source sans quitter en cas d'erreur.
+
+        Returns:
+            int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
+
+        """
+        self.init_compiler()
+        self.__pile.append(self.__nouvel_etat())
+        self.__etat_entree = self.__nouvel_etat()
+        self.__etat_initial = self.__etat_entree
+        try:
+            return self.__AXIOME()
+        except IndexError:
+            return 23
+        except RecursionError:
+            return 32
+
+    def message_erreur(
+            self,
+            e:int
+    ):
+        """Décrit l'erreur de syntaxe e et sa position.
+
+        Args:
+            e(int): La clé du dictionnaire erreurs.
+
+        Returns:
+            str, le message d'erreur.
+
+        """
+        return "erreur de syntaxe : {} à la position {}".format(
+            Compilateur.ERREURS[e] if e in Compilateur.ERREURS
+            else "erreur inconnue",
+            self.__p,
+        )
+
+    def optimiser(self):
+        """Supprime les états qui ne font que sauter vers un autre état.
+
+        Les instructions 'boucle', 'si' et 'fin' produisent des états dont
+        la seule transition, sur Quadruplet.JOKER, ne fait rien et mène à
+        un autre état. Les transitions qui y arrivent sont redirigées vers leur
+        destination finale, puis ces états sont retirés de la table.
+        L'état initial et les sauts qui forment un cycle sont conservés.
+        Les positions des sauts retirés sont reportées sur les transitions
+        redirigées (Quadruplet.positions_sautees), pour les points d'arrêt
+        du Debogueur.
+
+        Returns:
+            int: le nombre de transitions supprimées.
+
+        """
+        transitions = dict()
+        for quad in self.p_turing:
+            transitions.setdefault(quad.etat_i, list()).append(quad)
+
+        sauts = dict()
+        for q, quads in transitions.items():
+            if (len(quads) == 1
+                    and quads[0].caractere == Quadruplet.JOKER
+                    and quads[0].action == Quadruplet.RIEN
+                    and not quads[0].ecriture):
+                sauts[q] = quads[0].etat_f
+
+        cibles = dict()
+        for q in sauts:
+            r = q
+            vus = set()
+            while r in sauts and r not in vus:
+                vus.add(r)
+                r = sauts[r]
+            if r not in sauts:
+                cibles[q] = r
+
+        # les positions des sauts parcourus de q jusqu'à cibles[q]
+        sautees = dict()
+        for q in cibles:
+            sautees[q] = set()
+            r = q
+            while r in sauts:
+                quad = transitions[r][0]
+                sautees[q] |= {quad.position} | quad.positions_sautees
+                r = sauts[r]
+
+        initial = self.__etat_initial
+        taille = len(self.p_turing)
+        self.p_turing = [
+            quad for quad in self.p_turing
+            if quad.etat_i not in cibles or quad.etat_i == initial
+        ]
+        for quad in self.p_turing:
+            if quad.etat_f in cibles:
+                quad.positions_sautees |= sautees[quad.etat_f]
+                quad.etat_f = cibles[quad.etat_f]
+        return taille - len(self.p_turing)
+
     def __AXIOME(self):
         """AXIOME -> PROGRAMME ESPACES '#'
 
@@ -267,25 +598,22 @@ class Compilateur:
     def __PROGRAMME(self):
         """PROGRAMME -> '#' | '}' | INSTRUCTION ESPACES PROGRAMME
 
+        La récursion à droite est déroulée en boucle : la profondeur de la
+        pile Python ne dépend que de l'imbrication des instructions.
+
         Returns:
             int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
 
         """
-        if self.__programme[self.__p] == '#':
-            return 0
-        if self.__programme[self.__p] == '}':
-            return 0
-        e = self.__INSTRUCTION()
-        if e:
-            return e
-        e = self.__ESPACES()
-        e = self.__PROGRAMME()
-        if e:
-            return e
+        while self.__programme[self.__p] not in ('#', '}'):
+            e = self.__INSTRUCTION()
+            if e:
+                return e
+            e = self.__ESPACES()
         return 0
 
     def __INSTRUCTION(self):
-        """INSTRUCTION -> GAUCHE | BOUCLE | ... | COMMENTAIRE
+        """INSTRUCTION -> GAUCHE | BOUCLE | ... | COMMENTAIRE | ECRIRE
 
         Returns:
             int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
@@ -297,15 +625,20 @@ class Compilateur:
             's': self.__SI,
             'f': self.__FIN,
             'D': self.__DROITE,
-            '1': self.__BATON,
-            '0': self.__ZERO,
             'P': self.__PAUSE,
             'I': self.__IMPRIMER,
             '%': self.__COMMENTAIRE,
+            'r': self.__ROUTINE,
+            'a': self.__APPEL,
+            '@': self.__RUBAN,
         }
+        self.__debut = self.__p
         if self.__programme[self.__p] in instructions:
             e = instructions[self.__programme[self.__p]]()
             return e
+        if (self.__programme[self.__p] == "'"
+                or self.__programme[self.__p] in self.alphabet):
+            return self.__ECRIRE()
         return 19
 
     def __FIN(self):
@@ -329,8 +662,7 @@ class Compilateur:
         q0 = self.__etat_entree
         etat_sortie = self.__nouvel_etat()
         q1 = self.__pile[-1]
-        self.p_turing.append(Quadruplet(q0, '0', '0', q1, "FIN"))
-        self.p_turing.append(Quadruplet(q0, '1', '1', q1, "FIN"))
+        self.__emettre(q0, Quadruplet.JOKER, Quadruplet.RIEN, q1, "FIN")
         self.__etat_entree = etat_sortie
 
         return 0
@@ -350,6 +682,111 @@ class Compilateur:
                 break
         return 0
 
+    def __ROUTINE(self):
+        """ROUTINE -> 'routine' ESPACES* NOM ESPACES* PROGRAMME ESPACES*
+                ACCOLADE_FERMANTE
+
+        Définit une routine. Son corps est compilé pour vérifier la syntaxe,
+        puis le code produit est abandonné : le corps est recompilé à
+        chaque appel.
+
+        Returns:
+            int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
+
+        """
+        for c in 'routine':
+            if self.__programme[self.__p] != c:
+                return 24
+            self.__p += 1
+
+        e = self.__ESPACES()
+        e = self.__NOM()
+        if e:
+            return e
+        nom = self.__nom
+        if nom in self.__routines:
+            return 33
+        self.__routines[nom] = self.__p
+
+        q0 = self.__etat_entree
+        ruban = self.__ruban
+        n = len(self.p_turing)
+        self.__appels.append(nom)
+        e = self.__ESPACES()
+        e = self.__PROGRAMME()
+        if e:
+            return e
+        e = self.__ESPACES()
+        e = self.__ACCOLADE_FERMANTE()
+        if e:
+            return e
+        self.__appels.pop()
+        del self.p_turing[n:]
+        self.__etat_entree = q0
+        self.__ruban = ruban
+
+        return 0
+
+    def __APPEL(self):
+        """APPEL -> 'appel' ESPACES* NOM
+
+        Développe le corps de la routine à partir de l'état d'entrée courant.
+
+        Returns:
+            int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
+
+        """
+        for c in 'appel':
+            if self.__programme[self.__p] != c:
+                return 25
+            self.__p += 1
+
+        e = self.__ESPACES()
+        e = self.__NOM()
+        if e:
+            return e
+        nom = self.__nom
+        if nom not in self.__routines:
+            return 27
+        if nom in self.__appels:
+            return 28
+
+        retour = self.__p
+        self.__p = self.__routines[nom]
+        self.__appels.append(nom)
+        e = self.__ESPACES()
+        e = self.__PROGRAMME()
+        if e:
+            return e
+        e = self.__ESPACES()
+        e = self.__ACCOLADE_FERMANTE()
+        if e:
+            return e
+        self.__appels.pop()
+        self.__p = retour
+
+        return 0
+
+    def __RUBAN(self):
+        """RUBAN -> '@' [0-9]+
+
+        Sélectionne le ruban lu et modifié par les instructions suivantes.
+
+        Returns:
+            int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
+
+        """
+        if self.__programme[self.__p] != '@':
+            return 29
+        self.__p += 1
+        debut = self.__p
+        while self.__programme[self.__p] in '0123456789':
+            self.__p += 1
+        if self.__p == debut:
+            return 30
+        self.__ruban = int(self.__programme[debut:self.__p])
+        return 0
+
     def __BOUCLE(self):
         """BOUCLE -> 'boucle' ESPACES* PROGRAMME ESPACES* ACCOLADE_FERMANTE
 
@@ -379,6 +816,7 @@ class Compilateur:
         self.__p += 1
 
         q0 = self.__etat_entree
+        debut = self.__debut
         etat_sortie = self.__nouvel_etat()
         self.__pile.append(etat_sortie)
 
@@ -392,8 +830,9 @@ class Compilateur:
             return e
         
         # génération du code cible
-        self.p_turing.append(Quadruplet(self.__etat_entree, '0', '0', q0, "BCL"))
-        self.p_turing.append(Quadruplet(self.__etat_entree, '1', '1', q0, "BCL"))
+        self.__debut = debut
+        self.__emettre(self.__etat_entree, Quadruplet.JOKER, Quadruplet.RIEN,
+                       q0, "BCL")
         self.__etat_entree = etat_sortie
         self.__pile.pop()
 
@@ -402,7 +841,7 @@ class Compilateur:
     def __SI(self):
         """Instruction Conditionnelle.
 
-        SI -> 'si' ESPACES* PARENTHESE_OUVRANTE ZERO_OU_UN ESPACES*
+        SI -> 'si' ESPACES* PARENTHESE_OUVRANTE SYMBOLE ESPACES*
                 PARENTHESE_FERMANTE
 
         Returns:
@@ -417,6 +856,7 @@ class Compilateur:
         self.__p += 1
 
         q0 = self.__etat_entree
+        debut = self.__debut
         etat_sortie = self.__nouvel_etat()
         q1 = self.__nouvel_etat()
 
@@ -425,20 +865,18 @@ class Compilateur:
         if e:
             return e
         e = self.__ESPACES()
-        e = self.__ZERO_OU_UN()
-        c0 = self.__ZU
+        e = self.__SYMBOLE()
+        if e:
+            return e
+        c0 = self.__symbole
         e = self.__ESPACES()
         e = self.__PARENTHESE_FERMANTE()
         if e:
             return e
-        if c0 == '0':
-            # génération du code cible
-            self.p_turing.append(Quadruplet(q0, '0', '0', q1, "SI"))
-            self.p_turing.append(Quadruplet(q0, '1', '1', etat_sortie, "SI"))
-        else:
-            # génération du code cible
-            self.p_turing.append(Quadruplet(q0, '0', '0', etat_sortie, "SI"))
-            self.p_turing.append(Quadruplet(q0, '1', '1', q1, "SI"))
+        # génération du code cible
+        self.__emettre(q0, c0, Quadruplet.RIEN, q1, "SI")
+        self.__emettre(q0, Quadruplet.JOKER, Quadruplet.RIEN, etat_sortie,
+                       "SI")
 
         e = self.__ESPACES()
         self.__etat_entree = q1
@@ -452,8 +890,9 @@ class Compilateur:
             return e
         
         # génération du code cible
-        self.p_turing.append(Quadruplet(self.__etat_entree, '0', '0', etat_sortie, "SI"))
-        self.p_turing.append(Quadruplet(self.__etat_entree, '1', '1', etat_sortie, "SI"))
+        self.__debut = debut
+        self.__emettre(self.__etat_entree, Quadruplet.JOKER, Quadruplet.RIEN,
+                       etat_sortie, "SI")
         self.__etat_entree = etat_sortie
 
         return 0
@@ -472,8 +911,7 @@ class Compilateur:
         # génération du code cible
         q0 = self.__etat_entree
         etat_sortie = self.__nouvel_etat()
-        self.p_turing.append(Quadruplet(q0, '0', 'G', etat_sortie, "GAU"))
-        self.p_turing.append(Quadruplet(q0, '1', 'G', etat_sortie, "GAU"))
+        self.__emettre(q0, Quadruplet.JOKER, 'G', etat_sortie, "GAU")
         self.__etat_entree = etat_sortie
 
         return 0
@@ -492,53 +930,32 @@ class Compilateur:
         # génération du code cible
         q0 = self.__etat_entree
         etat_sortie = self.__nouvel_etat()
-        self.p_turing.append(Quadruplet(q0, '0', 'D', etat_sortie, "DRO"))
-        self.p_turing.append(Quadruplet(q0, '1', 'D', etat_sortie, "DRO"))
+        self.__emettre(q0, Quadruplet.JOKER, 'D', etat_sortie, "DRO")
         self.__etat_entree = etat_sortie
 
         return 0
 
 
-    def __BATON(self):
-        """BATON -> '1'
+    def __ECRIRE(self):
+        """ECRIRE -> SYMBOLE
 
         Returns:
             int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
 
         """
-        if self.__programme[self.__p] != '1':
-            return 10
-        self.__p += 1
-        
-        # génération du code cible
-        q0 = self.__etat_entree
-        etat_sortie = self.__nouvel_etat()
-        self.p_turing.append(Quadruplet(q0, '0', '1', etat_sortie, "BAT"))
-        self.p_turing.append(Quadruplet(q0, '1', '1', etat_sortie, "BAT"))
-        self.__etat_entree = etat_sortie
-
-        return 0
-
-
-    def __ZERO(self):
-        """ZERO -> '0'
-
-        Returns:
-            int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
+        e = self.__SYMBOLE()
+        if e:
+            return e
 
-        """
-        if self.__programme[self.__p] != '0':
-            return 11
-        self.__p += 1
+        # génération du code cible
         q0 = self.__etat_entree
         etat_sortie = self.__nouvel_etat()
-        self.p_turing.append(Quadruplet(q0, '0', '0', etat_sortie, "ZER"))
-        self.p_turing.append(Quadruplet(q0, '1', '0', etat_sortie, "ZER"))
+        self.__emettre(q0, Quadruplet.JOKER, self.__symbole, etat_sortie,
+                       "ECR", True)
         self.__etat_entree = etat_sortie
 
         return 0
 
-
     def __PAUSE(self):
         """PAUSE -> 'P'
 
@@ -552,8 +969,7 @@ class Compilateur:
         # génération du code cible
         q0 = self.__etat_entree
         etat_sortie = self.__nouvel_etat()
-        self.p_turing.append(Quadruplet(q0, '0', 'P', etat_sortie, "PAU"))
-        self.p_turing.append(Quadruplet(q0, '1', 'P', etat_sortie, "PAU"))
+        self.__emettre(q0, Quadruplet.JOKER, 'P', etat_sortie, "PAU")
         self.__etat_entree = etat_sortie
 
         return 0
@@ -571,8 +987,7 @@ class Compilateur:
         # génération du code cible
         q0 = self.__etat_entree
         etat_sortie = self.__nouvel_etat()
-        self.p_turing.append(Quadruplet(q0, '0', 'I', etat_sortie, "IMP"))
-        self.p_turing.append(Quadruplet(q0, '1', 'I', etat_sortie, "IMP"))
+        self.__emettre(q0, Quadruplet.JOKER, 'I', etat_sortie, "IMP")
         self.__etat_entree = etat_sortie
 
         return 0
@@ -614,19 +1029,48 @@ class Compilateur:
         self.__p += 1
         return 0
 
-    def __ZERO_OU_UN(self):
-        """ZERO_OU_UN -> '1' | '0'
+    def __SYMBOLE(self):
+        """SYMBOLE -> "'" CARACTERE "'" | CARACTERE
+
+        Le caractère doit appartenir à l'alphabet. La forme entre
+        apostrophes permet d'écrire un symbole qui est aussi une instruction
+        ou un espace.
 
         Returns:
             int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
 
         """
-        if self.__programme[self.__p] not in ['1', '0']:
+        if self.__programme[self.__p] == "'":
+            if self.__programme[self.__p+1] not in self.alphabet:
+                return 22
+            if self.__programme[self.__p+2] != "'":
+                return 31
+            self.__symbole = self.__programme[self.__p+1]
+            self.__p += 3
+            return 0
+        if self.__programme[self.__p] not in self.alphabet:
             return 22
-        self.__ZU = self.__programme[self.__p]
+        self.__symbole = self.__programme[self.__p]
         self.__p += 1
         return 0
 
+    def __NOM(self):
+        """NOM -> [A-Za-z0-9_]+
+
+        Returns:
+            int: 0 pour succes, e (clé du dictionnaire erreurs) pour erreur
+
+        """
+        debut = self.__p
+        while (self.__programme[self.__p].isascii()
+                and (self.__programme[self.__p].isalnum()
+                     or self.__programme[self.__p] == '_')):
+            self.__p += 1
+        if self.__p == debut:
+            return 26
+        self.__nom = self.__programme[debut:self.__p]
+        return 0
+
     def __ESPACES(self):
         """ESPACES -> ' ' | '\r' | '\n'
 
@@ -641,6 +1085,27 @@ class Compilateur:
         return 0
 
 
+    def __emettre(
+            self,
+            etat_i:int,
+            caractere:str,
+            action:str,
+            etat_f:int,
+            provenance:str,
+            ecriture:bool = False
+    ):
+        """Ajoute une transition sur le ruban sélectionné au programme."""
+        self.p_turing.append(Quadruplet(
+            etat_i,
+            caractere,
+            action,
+            etat_f,
+            provenance,
+            self.__ruban,
+            self.__debut,
+            ecriture
+        ))
+
     def __nouvel_etat(self):
         """Génère de nouveaux états.
 
@@ -658,61 +1123,120 @@ class Execution:
     Attributes:
         MT(Machine): Le programme Turing produit par le compilateur.
         etatCrt(int): L'état initial de la machine.
-        ruban(Ruban): Le ruban de la machine.
+        rubans(list(Ruban)): Les rubans de la machine.
+        ruban(Ruban): Le premier ruban de la machine.
+        pas(int): Le nombre de transitions effectuées.
+        derniere(Quadruplet): La dernière transition effectuée par
+                executer, None avant la première.
+        __table(dict): Les transitions indexées par état.
 
-    Method:
+    Methods:
         interprete: Interprete le langage du programme Turing.
+        executer: Interprete jusqu'à l'arrêt ou à un point d'arrêt.
+        transitions: Les transitions d'un état.
     """
     def __init__(
             self,
             machine:Machine,
             etatCrt:int,
-            ruban:Ruban,
+            ruban,
             priorite:int = 10
     ):
+        """Instancie une Execution.
+
+        Args:
+            machine(Machine): Le programme Turing.
+            etatCrt(int): L'état initial de la machine.
+            ruban(Ruban ou list(Ruban)): Le ruban, ou un ruban par tête de
+                    lecture pour une machine à plusieurs rubans.
+            priorite(int): Non utilisé.
+
+        """
         self.MT = machine
         self.etatCrt = etatCrt
-        self.ruban = ruban
+        self.rubans = list(ruban) if isinstance(ruban, (list, tuple)) \
+            else [ruban]
+        self.ruban = self.rubans[0]
         self.priorite = priorite
+        self.pas = 0
+        self.derniere = None
+        self.__table = None
+
+    def __indexer(self):
+        """Indexe les transitions par état.
+
+        Toutes les transitions d'un état portent sur le même ruban. Si
+        plusieurs transitions ont le même état et le même caractère, la
+        première de la liste l'emporte.
+
+        Returns:
+            dict(int, tuple(int, dict(str, Quadruplet))), pour chaque état
+            d'entrée, le ruban lu et les transitions par caractère.
+
+        """
+        if self.__table is None:
+            self.__table = dict()
+            for quad in self.MT.programme_turing:
+                _, quads = self.__table.setdefault(
+                    quad.etat_i,
+                    (quad.ruban, dict())
+                )
+                quads.setdefault(quad.caractere, quad)
+        return self.__table
+
+    def transitions(
+            self,
+            etat:int
+    ):
+        """Les transitions d'un état.
+
+        Args:
+            etat(int): L'état d'entrée.
+
+        Returns:
+            list(Quadruplet), les transitions de l'état, vide si c'est un
+            état d'arrêt.
+
+        """
+        if etat not in self.__indexer():
+            return list()
+        return list(self.__indexer()[etat][1].values())
 
     def interprete(self):
         """Interprete le programme Turing.
 
-        Effectue les opérations selon la liste des transitions.
+        Effectue les opérations selon la liste des transitions, jusqu'à ce
+        qu'aucune transition ne corresponde à l'état courant et au
+        caractère lu. La transition sur Quadruplet.JOKER sert quand aucune
+        transition ne porte sur le caractère lu.
 
         """
+        table = self.__indexer()
         while True:
-            c = self.ruban.cellule(self.ruban.oeil)
-            i = 0
-            b1 = False
-            while True:
-                if i >= len(self.MT.programme_turing):
-                    b1 = True
-                    break
-                quad = self.MT.programme_turing[i]
-                if (quad.etat_i == self.etatCrt) and (quad.caractere == c):
-                    break
-                # self.MT.programme_turing[i].afficher()
-                i += 1
-            if b1:
+            if self.etatCrt not in table:
                 break
-            if quad.action == 'G':
-                self.ruban.oeil -= 1
-                if self.ruban.oeil <= 0:
+            k, quads = table[self.etatCrt]
+            ruban = self.rubans[k]
+            quad = quads.get(ruban.cellule(ruban.oeil))
+            if quad is None:
+                quad = quads.get(Quadruplet.JOKER)
+            if quad is None:
+                break
+            if quad.ecriture:
+                ruban.affecter(ruban.oeil, quad.action)
+            elif quad.action == 'G':
+                ruban.oeil -= 1
+                if ruban.oeil <= 0:
                     print("La tête de lecture arrive à l'extrémité gauche du "
                           "ruban")
-                    self.ruban.afficher()
+                    ruban.afficher()
                     sys.exit(3)
             elif quad.action == 'D':
-                self.ruban.oeil += 1
-                if self.ruban.oeil >= Ruban.DIM:
+                ruban.oeil += 1
+                if ruban.oeil >= len(ruban.ruban):
                     print("La tête de lecture arrive à l'extrémité droite du ruban")
-                    self.ruban.afficher()
+                    ruban.afficher()
                     sys.exit(3)
-            elif quad.action == '1':
-                self.ruban.affecter(self.ruban.oeil,'1')
-            elif quad.action == '0':
-                self.ruban.affecter(self.ruban.oeil,'0')
             elif quad.action == 'P':
                 print("appuyer sur une touche pour continuer : ")
                 try:
@@ -720,7 +1244,475 @@ class Execution:
                 except IOError:
                     pass
             elif quad.action == 'I':
-                self.ruban.afficher()
+                for r in self.rubans:
+                    r.afficher()
 
             self.etatCrt = quad.etat_f
+            self.pas += 1
+
+    def executer(
+            self,
+            etats:set = None,
+            oeils:dict = None,
+            limite:int = None,
+            verifier = None,
+            apres:set = None
+    ):
+        """Interprete le programme jusqu'à l'arrêt ou à un point d'arrêt.
+
+        Reprend la boucle d'interprete en y testant les points d'arrêt :
+        elle sert au Debogueur, interprete reste plus rapide sans point
+        d'arrêt.
 
+        Args:
+            etats(set(int)): S'arrête avant une transition depuis ces états.
+            oeils(dict(int, set(int))): S'arrête quand la tête du ruban k
+                    arrive sur l'une des cases oeils[k].
+            limite(int): S'arrête quand pas atteint limite.
+            verifier(function): Appelée avec l'Execution après chaque
+                    écriture sur un ruban, s'arrête si elle renvoie True.
+            apres(set(Quadruplet)): S'arrête après l'une de ces transitions.
+
+        Returns:
+            str, 'etat', 'oeil', 'pas', 'ecriture' ou 'transition' selon le
+            point d'arrêt atteint, None si la machine s'est arrêtée.
+
+        """
+        table = self.__indexer()
+        while True:
+            if etats and self.etatCrt in etats:
+                return 'etat'
+            if limite is not None and self.pas >= limite:
+                return 'pas'
+            if self.etatCrt not in table:
+                return None
+            k, quads = table[self.etatCrt]
+            ruban = self.rubans[k]
+            quad = quads.get(ruban.cellule(ruban.oeil))
+            if quad is None:
+                quad = quads.get(Quadruplet.JOKER)
+            if quad is None:
+                return None
+            arret = None
+            if quad.ecriture:
+                ruban.affecter(ruban.oeil, quad.action)
+                if verifier is not None:
+                    arret = 'ecriture'
+            elif quad.action == 'G':
+                ruban.oeil -= 1
+                if ruban.oeil <= 0:
+                    print("La tête de lecture arrive à l'extrémité gauche du "
+                          "ruban")
+                    ruban.afficher()
+                    sys.exit(3)
+                if oeils and ruban.oeil in oeils.get(k, ()):
+                    arret = 'oeil'
+            elif quad.action == 'D':
+                ruban.oeil += 1
+                if ruban.oeil >= len(ruban.ruban):
+                    print("La tête de lecture arrive à l'extrémité droite du ruban")
+                    ruban.afficher()
+                    sys.exit(3)
+                if oeils and ruban.oeil in oeils.get(k, ()):
+                    arret = 'oeil'
+            elif quad.action == 'P':
+                print("appuyer sur une touche pour continuer : ")
+                try:
+                    input()
+                except IOError:
+                    pass
+            elif quad.action == 'I':
+                for r in self.rubans:
+                    r.afficher()
+
+            self.etatCrt = quad.etat_f
+            self.pas += 1
+            self.derniere = quad
+            if arret == 'ecriture' and not verifier(self):
+                arret = None
+            if arret:
+                return arret
+            if apres and quad in apres:
+                return 'transition'
+
+
+class PointArret:
+    """Point d'arrêt conditionnel d'un Debogueur.
+
+    Attributes:
+        genre(str): {'etat','position','oeil','pas','ruban'}.
+        valeur: L'état, la position dans le programme source, la case, le
+                nombre de pas ou le prédicat sur les rubans.
+        ruban(int): Le ruban de la tête de lecture, pour le genre 'oeil'.
+        condition(function): Appelée avec l'Execution quand le point
+                d'arrêt est atteint, l'arrêt n'a lieu que si elle renvoie
+                True. None pour un arrêt inconditionnel.
+
+    Method:
+        afficher(): Affiche le point d'arrêt.
+
+    """
+    def __init__(
+            self,
+            genre:str,
+            valeur,
+            ruban:int = 0,
+            condition = None
+    ):
+        self.genre = genre
+        self.valeur = valeur
+        self.ruban = ruban
+        self.condition = condition
+
+    def afficher(self):
+        """Affiche le point d'arrêt."""
+        print("arrêt {} {}{}{}".format(
+            self.genre,
+            self.valeur,
+            " @{}".format(self.ruban) if self.genre == 'oeil' else "",
+            " si condition" if self.condition else "",
+        ))
+
+
+class Debogueur:
+    """Débogueur d'une Execution avec des points d'arrêt conditionnels.
+
+    Les points d'arrêt sont traduits en arguments d'Execution.executer :
+    les états à surveiller (points sur un état ou une position du
+    programme source), les cases de chaque ruban, le prochain nombre de pas,
+    une fonction appelée après les écritures (prédicats sur les rubans) et
+    les transitions suivies d'un saut retiré par Compilateur.optimiser.
+    Entre deux points d'arrêt, la machine tourne dans la boucle
+    d'exécution, sans repasser par le débogueur.
+
+    Attributes:
+        execution(Execution): L'exécution déboguée.
+        points(list(PointArret)): Les points d'arrêt.
+        termine(bool): La machine s'est arrêtée.
+        __declenche(PointArret): Le point d'arrêt sur les rubans atteint.
+        __valeurs(dict(PointArret, bool)): La dernière valeur de chaque
+                prédicat sur les rubans.
+        __arrete(bool): L'exécution est suspendue sur un point d'arrêt ou
+                après avancer().
+
+    Methods:
+        arret_etat(): Ajoute un point d'arrêt sur un état.
+        arret_position(): Ajoute un point d'arrêt sur une instruction.
+        arret_oeil(): Ajoute un point d'arrêt sur une case.
+        arret_pas(): Ajoute un point d'arrêt sur le nombre de pas.
+        arret_ruban(): Ajoute un point d'arrêt sur un prédicat des rubans.
+        supprimer(): Supprime un point d'arrêt.
+        continuer(): Exécute jusqu'au prochain point d'arrêt.
+        avancer(): Exécute pas à pas.
+        afficher(): Affiche l'état courant et les rubans.
+
+    Examples:
+        d = Debogueur(Execution(MT, 1, R, 0))
+        d.arret_oeil(40)
+        d.arret_ruban(lambda ex: ex.ruban.cellule(50) == '1')
+        while d.continuer():
+            d.afficher()
+
+    """
+    def __init__(
+            self,
+            execution:Execution
+    ):
+        self.execution = execution
+        self.points = list()
+        self.termine = False
+        self.__declenche = None
+        self.__valeurs = dict()
+        self.__arrete = False
+
+    def __ajouter(
+            self,
+            point:PointArret
+    ):
+        self.points.append(point)
+        return point
+
+    def arret_etat(
+            self,
+            etat:int,
+            condition = None
+    ):
+        """S'arrête avant une transition depuis l'état.
+
+        Args:
+            etat(int): L'état de la machine.
+            condition(function): La condition sur l'Execution, None par
+                    defaut.
+
+        Returns:
+            PointArret, le point d'arrêt ajouté.
+
+        """
+        return self.__ajouter(PointArret('etat', etat, condition=condition))
+
+    def arret_position(
+            self,
+            position:int,
+            condition = None
+    ):
+        """S'arrête avant une transition produite par l'instruction à cette
+        position du programme source.
+
+        Pour un saut retiré par Compilateur.optimiser, s'arrête après les
+        transitions redirigées qui menaient au saut, c'est-à-dire quand le
+        saut aurait été exécuté.
+
+        Args:
+            position(int): La position de l'instruction dans le programme
+                    source.
+            condition(function): La condition sur l'Execution, None par
+                    defaut.
+
+        Returns:
+            PointArret, le point d'arrêt ajouté.
+
+        Raises:
+            ValueError: Aucune transition ne provient de cette position,
+                    par exemple une position qui n'est pas le début d'une
+                    instruction, ou un saut jamais atteint retiré par
+                    Compilateur.optimiser.
+
+        """
+        if not any(quad.provient_de(position)
+                   for quad in self.execution.MT.programme_turing):
+            raise ValueError(
+                "aucune transition ne provient de la position {}"
+                .format(position))
+        return self.__ajouter(
+            PointArret('position', position, condition=condition))
+
+    def arret_oeil(
+            self,
+            oeil:int,
+            ruban:int = 0,
+            condition = None
+    ):
+        """S'arrête quand la tête de lecture arrive sur la case.
+
+        Args:
+            oeil(int): L'indice de la case.
+            ruban(int): Le numéro du ruban, 0 par defaut.
+            condition(function): La condition sur l'Execution, None par
+                    defaut.
+
+        Returns:
+            PointArret, le point d'arrêt ajouté.
+
+        """
+        return self.__ajouter(PointArret('oeil', oeil, ruban, condition))
+
+    def arret_pas(
+            self,
+            pas:int,
+            condition = None
+    ):
+        """S'arrête après le nombre de pas donné.
+
+        Args:
+            pas(int): Le nombre de transitions effectuées.
+            condition(function): La condition sur l'Execution, None par
+                    defaut.
+
+        Returns:
+            PointArret, le point d'arrêt ajouté.
+
+        """
+        return self.__ajouter(PointArret('pas', pas, condition=condition))
+
+    def arret_ruban(
+            self,
+            predicat
+    ):
+        """S'arrête quand le prédicat sur les rubans devient vrai.
+
+        Le prédicat n'est évalué qu'après une écriture sur un ruban. Il est
+        aussi évalué à l'ajout du point d'arrêt : s'il est déjà vrai, l'arrêt
+        n'a lieu qu'après qu'il est redevenu faux puis vrai.
+
+        Args:
+            predicat(function): Appelée avec l'Execution, renvoie un bool.
+
+        Returns:
+            PointArret, le point d'arrêt ajouté.
+
+        """
+        point = self.__ajouter(PointArret('ruban', predicat))
+        self.__valeurs[point] = bool(predicat(self.execution))
+        return point
+
+    def supprimer(
+            self,
+            point:PointArret
+    ):
+        """Supprime un point d'arrêt.
+
+        Args:
+            point(PointArret): Le point d'arrêt à supprimer.
+
+        """
+        self.points.remove(point)
+        self.__valeurs.pop(point, None)
+
+    def __etats(self):
+        """Les états et les transitions surveillés par les points 'etat' et
+        'position'.
+
+        Returns:
+            tuple(set(int), set(Quadruplet)), les états avant lesquels
+            s'arrêter, et les transitions suivies d'un saut retiré après
+            lesquelles s'arrêter.
+
+        """
+        etats = set()
+        positions = set()
+        for point in self.points:
+            if point.genre == 'etat':
+                etats.add(point.valeur)
+            elif point.genre == 'position':
+                positions.add(point.valeur)
+        apres = set()
+        if positions:
+            for quad in self.execution.MT.programme_turing:
+                if quad.position in positions:
+                    etats.add(quad.etat_i)
+                if quad.positions_sautees & positions:
+                    apres.add(quad)
+        return etats, apres
+
+    def __verifier(
+            self,
+            execution:Execution
+    ):
+        """Évalue les prédicats sur les rubans après une écriture.
+
+        Returns:
+            bool, un prédicat est passé de faux à vrai.
+
+        """
+        self.__declenche = None
+        for point in self.points:
+            if point.genre == 'ruban':
+                valeur = bool(point.valeur(execution))
+                if valeur and not self.__valeurs[point] \
+                        and self.__declenche is None:
+                    self.__declenche = point
+                self.__valeurs[point] = valeur
+        return self.__declenche is not None
+
+    def __atteint(
+            self,
+            cause:str
+    ):
+        """Cherche le point d'arrêt atteint et vérifie sa condition.
+
+        Args:
+            cause(str): La valeur renvoyée par Execution.executer.
+
+        Returns:
+            PointArret, le point d'arrêt atteint, None si aucun.
+
+        """
+        if cause == 'ecriture':
+            return self.__declenche
+        ex = self.execution
+        for point in self.points:
+            if point.genre == 'etat':
+                atteint = ex.etatCrt == point.valeur
+            elif point.genre == 'position':
+                atteint = any(quad.position == point.valeur
+                              for quad in ex.transitions(ex.etatCrt)) or (
+                    cause != 'etat' and ex.derniere is not None
+                    and point.valeur in ex.derniere.positions_sautees)
+            elif point.genre == 'oeil':
+                atteint = (cause == 'oeil'
+                           and ex.rubans[point.ruban].oeil == point.valeur)
+            elif point.genre == 'pas':
+                atteint = ex.pas == point.valeur
+            else:
+                atteint = False
+            if atteint and (point.condition is None or point.condition(ex)):
+                return point
+        return None
+
+    def continuer(self):
+        """Exécute jusqu'au prochain point d'arrêt dont la condition est
+        vraie.
+
+        Après un arrêt, le premier pas est toujours effectué, pour ne pas
+        s'arrêter à nouveau sur le même état.
+
+        Returns:
+            PointArret, le point d'arrêt atteint, None si la machine s'est
+            arrêtée.
+
+        """
+        ex = self.execution
+        etats, apres = self.__etats()
+        oeils = dict()
+        for point in self.points:
+            if point.genre == 'oeil':
+                oeils.setdefault(point.ruban, set()).add(point.valeur)
+        verifier = self.__verifier if any(
+            point.genre == 'ruban' for point in self.points) else None
+
+        premier = self.__arrete
+        while not self.termine:
+            limite = min(
+                [point.valeur for point in self.points
+                 if point.genre == 'pas' and point.valeur > ex.pas]
+                + ([ex.pas + 1] if premier else []),
+                default=None
+            )
+            cause = ex.executer(
+                None if premier else etats,
+                oeils,
+                limite,
+                verifier,
+                apres
+            )
+            if cause is None:
+                self.termine = True
+                return None
+            point = self.__atteint(cause)
+            if point is not None:
+                self.__arrete = True
+                return point
+            premier = cause == 'etat'
+        return None
+
+    def avancer(
+            self,
+            n:int = 1
+    ):
+        """Exécute n pas sans tenir compte des points d'arrêt.
+
+        Args:
+            n(int): Le nombre de pas, 1 par defaut.
+
+        Returns:
+            bool, False si la machine s'est arrêtée.
+
+        """
+        if not self.termine:
+            if self.execution.executer(limite=self.execution.pas + n) is None:
+                self.termine = True
+            self.__arrete = True
+        return not self.termine
+
+    def afficher(self):
+        """Affiche l'état courant, le nombre de pas et les rubans."""
+        ex = self.execution
+        print("état {}, pas {}{}".format(
+            ex.etatCrt,
+            ex.pas,
+            ", arrêt" if self.termine else "",
+        ))
+        for quad in ex.transitions(ex.etatCrt):
+            quad.afficher()
+        for ruban in ex.rubans:
+            ruban.afficher()
@@ -6,31 +6,30 @@ def main():
     # lecture et normalisation du fichier source
     # lit le fichier comme fichier binaire
     try:
-        TSFile = open(sys.argv[1],'rb')
+        chaine = lire_source(sys.argv[1])
     except IndexError:
         print("paramètres d'appel incorrects")
         sys.exit(1)
     except FileNotFoundError:
         print("le fichier source '{}' n'existe pas.".format(sys.argv[1]))
         sys.exit(1)
-    else:
-        try:
-            chaine = ""
-            # encode en utf-8
-            for byte in TSFile.read():
-                chaine += chr(byte)
-        except IOError:
-            print("erreur en lecture du fichier source")
-            sys.exit(2)
-        finally:
-            TSFile.close()
+    except IOError:
+        print("erreur en lecture du fichier source")
+        sys.exit(2)
     
     # compile le programme source
-    c = Compilateur(chaine)
+    # l'alphabet est déclaré en tête du fichier source, "01" par défaut
+    try:
+        c = Compilateur(chaine)
+    except ValueError as e_value:
+        print(e_value)
+        sys.exit(2)
     c.compiler()
+    c.optimiser()
     
     # consruit la machine turing à partir du prgramme compilé
     MT = Machine(sys.argv[1], chaine, c.p_turing)
+    alphabet = c.alphabet
     c = None
 
     # lecture et controle des arguments
@@ -51,7 +50,10 @@ def main():
         sys.exit(2)
     
     # construit un ruban à partir des arguments
-    R = Ruban(n1, n2)
+    # et des rubans vides pour les autres têtes de lecture
+    R = [ruban_initial(n1, n2, alphabet)] + [
+        Ruban(blanc=alphabet[0]) for _ in range(1, MT.nb_rubans)
+    ]
     exec = Execution(MT, 1, R, 0)
     exec.interprete()
 